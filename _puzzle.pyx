@@ -0,0 +1,138 @@
+# distutils: language = c++
+# _puzzle.pyx - Cython versions of the hottest 8-puzzle primitives (build with: python setup.py build_ext --inplace)
+
+from libc.stdint cimport uint64_t, int8_t
+from libcpp.vector cimport vector
+from libcpp.queue cimport priority_queue
+from libcpp.unordered_map cimport unordered_map
+from libcpp.unordered_set cimport unordered_set
+from heuristics import GOAL, HAMMING, MANHATTAN
+from puzzle_utils import NEIGHBOR_IDX
+
+# C copies of the lookup tables, indexed by tile * 9 + position (filled in from heuristics.py at import)
+cdef int8_t MDIST[81]
+cdef int8_t HDIST[81]
+for _k in range(81):
+    MDIST[_k] = MANHATTAN[_k]
+    HDIST[_k] = HAMMING[_k]
+
+# C copy of puzzle_utils.NEIGHBOR_IDX: up to 4 target indices per blank position, padded with -1
+cdef int NEIGHBORS[9][4]
+MOVES = [[move for _, move in NEIGHBOR_IDX[blank]] for blank in range(9)]
+for _blank in range(9):
+    for _k in range(4):
+        NEIGHBORS[_blank][_k] = NEIGHBOR_IDX[_blank][_k][0] if _k < len(NEIGHBOR_IDX[_blank]) else -1
+
+# swaps the 4-bit nibbles at positions i and j of a packed state
+cdef inline uint64_t swap_nibble(uint64_t s, int i, int j) nogil:
+    cdef uint64_t x = ((s >> (4 * i)) ^ (s >> (4 * j))) & 0xF
+    return s ^ (x << (4 * i)) ^ (x << (4 * j))
+
+# sums a lookup table over the 9 positions of a packed state (the loop is unrolled by the compiler)
+cdef inline int table_sum(uint64_t s, const int8_t *table) nogil:
+    cdef int total = 0
+    cdef int pos
+    for pos in range(9):
+        total += table[((s >> (4 * pos)) & 0xF) * 9 + pos]
+    return total
+
+cdef int manhattan_c(uint64_t s) nogil:
+    return table_sum(s, MDIST)
+
+cdef int hamming_c(uint64_t s) nogil:
+    return table_sum(s, HDIST)
+
+# compiled heuristics.manhattan
+def manhattan(uint64_t state):
+    return manhattan_c(state)
+
+# compiled heuristics.hamming
+def hamming(uint64_t state):
+    return hamming_c(state)
+
+# a* search entirely in C++, same search order as solver.astar
+# inputs: start state (packed int), start blank index, use_manhattan (True for manhattan, False for hamming)
+# outputs: (solution path (list of moves), nodes expanded (int)), or None if there is no solution
+# function: nodes live in parallel vectors indexed by node id; the priority queue holds one 64-bit key per
+#           node, (-f) << 32 | id, so the largest key is the lowest f and, among equal f, the newest node
+# time complexity: O(b^d) where b is branching factor (max 4) and d is solution depth
+# space complexity: O(b^d) for storing all nodes in memory
+def astar(uint64_t start, int start_blank, bint use_manhattan):
+    cdef const int8_t *table = HDIST
+    cdef vector[uint64_t] states
+    cdef vector[int] gs, hs, blanks, parents
+    cdef vector[int8_t] move_ks
+    cdef priority_queue[long long] frontier
+    cdef unordered_map[uint64_t, int] best_cost
+    cdef unordered_set[uint64_t] explored
+    cdef long long key
+    cdef uint64_t state, next_state, tile
+    cdef int node_id, next_id, g, h, blank, prev_blank, k, target, next_h
+    cdef int nodes_expanded = 0
+    cdef uint64_t goal = GOAL
+    if use_manhattan:
+        table = MDIST
+
+    # node 0 is the start state
+    states.push_back(start)
+    gs.push_back(0)
+    hs.push_back(table_sum(start, table))
+    blanks.push_back(start_blank)
+    parents.push_back(-1)
+    move_ks.push_back(-1)
+    best_cost[start] = 0
+    frontier.push(-(<long long>hs[0]) << 32)
+
+    while not frontier.empty():
+        key = frontier.top()
+        frontier.pop()
+        node_id = <int>(key & 0xFFFFFFFF)
+        state = states[node_id]
+        g = gs[node_id]
+
+        # skip stale entries: a cheaper path to this state was pushed after this one
+        if g != best_cost[state]:
+            continue
+        explored.insert(state)
+        nodes_expanded += 1
+
+        if state == goal:
+            # reconstruct the path by following parent ids backwards
+            path = []
+            while parents[node_id] != -1:
+                path.append(MOVES[blanks[parents[node_id]]][move_ks[node_id]])
+                node_id = parents[node_id]
+            path.reverse()
+            return path, nodes_expanded
+
+        h = hs[node_id]
+        blank = blanks[node_id]
+        prev_blank = blanks[parents[node_id]] if parents[node_id] != -1 else -1
+        for k in range(4):
+            target = NEIGHBORS[blank][k]
+            if target < 0:
+                break
+            # skip the move that would just undo the last one
+            if target == prev_blank:
+                continue
+            tile = (state >> (4 * target)) & 0xF
+            next_state = swap_nibble(state, blank, target)
+            if explored.count(next_state):
+                continue
+            if best_cost.count(next_state) and best_cost[next_state] <= g + 1:
+                continue
+            best_cost[next_state] = g + 1
+            # only the moved tile's contribution to h changes
+            next_h = h + table[tile * 9 + blank] - table[tile * 9 + target]
+
+            next_id = states.size()
+            states.push_back(next_state)
+            gs.push_back(g + 1)
+            hs.push_back(next_h)
+            blanks.push_back(target)
+            parents.push_back(node_id)
+            move_ks.push_back(k)
+            frontier.push((-(<long long>(g + 1 + next_h)) << 32) | next_id)
+
+    # if we get here, no solution was found (shouldn't happen for solvable puzzles)
+    return None
@@ -4,12 +4,29 @@ import time
 import heapq
 # statistics is used for calculating standard deviations
 import statistics
+# Pool spreads the benchmark solves over all cpu cores
+from multiprocessing import Pool
 
 # Goal state for the puzzle
-# this is a tuple of tuples, meaning the order of the tiles matters
-GOAL = ((0, 1, 2),
-        (3, 4, 5),
-        (6, 7, 8))
+# states are flat, row-major bytes (9 tiles, 0 is the blank), so the goal board
+# ((0, 1, 2), (3, 4, 5), (6, 7, 8)) is bytes 0..8
+# bytes hash and compare in one C call and are much smaller than nested tuples
+GOAL = bytes(range(9))
+
+# MANHATTAN[tile * 9 + pos] is how many steps tile is from its goal when it sits at pos (0 for the blank)
+MANHATTAN = [abs(pos // 3 - tile // 3) + abs(pos % 3 - tile % 3) if tile else 0
+             for tile in range(9) for pos in range(9)]
+
+# NEIGHBORS[blank] lists every (target index, move) the blank can slide to from that index
+# it's built once here so get_neighbors doesn't need any boundary checks
+NEIGHBORS = [[] for _ in range(9)]
+for _i in range(3):
+    for _j in range(3):
+        for _di, _dj, _move in [(-1, 0, 'UP'), (1, 0, 'DOWN'), (0, -1, 'LEFT'), (0, 1, 'RIGHT')]:
+            _ni, _nj = _i + _di, _j + _dj
+            # the if clause is a boundary check - we must stay inside the 3x3 grid
+            if 0 <= _ni < 3 and 0 <= _nj < 3:
+                NEIGHBORS[_i * 3 + _j].append((_ni * 3 + _nj, _move))
 
 # defines a node in the search tree
 class Node:
@@ -28,12 +45,9 @@ class Node:
         return self.f < other.f
 
 # finds where the blank (0) tile is
-# returns row, col of the blank tile
+# returns the index (0-8, row-major) of the blank tile in a bytes state
 def find_blank(state):
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                return i, j
+    return state.index(0)
 
 # count inversions to check if puzzle can be solved
 # inversions are when two tiles are in the wrong place
@@ -42,10 +56,9 @@ def is_solvable(state):
     # "flatten" the puzzle into a list of tiles (this makes the blank disappear)
     # we want it to disappear because it doesn't count as a tile, so it doesn't count towards inversions)
     flat = []
-    for row in state:
-        for num in row:
-            if num != 0:
-                flat.append(num)
+    for num in state:
+        if num != 0:
+            flat.append(num)
 
     # initialize inversions to 0
     # count inversions (how many times a tile is larger than its neighbor)
@@ -65,58 +78,39 @@ def is_solvable(state):
 def hamming(state):
     count = 0
     # iterate through each tile
-    for i in range(3):
-        for j in range(3):
-            # ignore blank tile
-            if state[i][j] != 0:
-                # the tile that *should* be at position [i][j] is at always at position [i*3+j]
-                if state[i][j] != i * 3 + j:
-                    # count goes up by 1 for each tile in wrong position
-                    count += 1
+    for pos, tile in enumerate(state):
+        # ignore blank tile
+        # the tile that *should* be at position pos is always tile pos
+        if tile != 0 and tile != pos:
+            # count goes up by 1 for each tile in wrong position
+            count += 1
     return count
 
 # Manhattan heuristic: returns the sum of distances each tile is from its goal
 # "how many steps away from the goal is the tile?"
 def manhattan(state):
     distance = 0
-    # iterate through each tile
-    for i in range(3):
-        for j in range(3):
-            tile = state[i][j]
-            # ignore blank tile
-            if tile != 0:
-                # these two lines give the row/col where the tile actually belongs
-                goal_row = tile // 3
-                goal_col = tile % 3
-                # abs gives absolute values (no negatives)
-                # first term is vertical steps, second term is horizontal steps
-                distance += abs(i - goal_row) + abs(j - goal_col)
+    # iterate through each tile and look up its distance in the precomputed table
+    for pos, tile in enumerate(state):
+        distance += MANHATTAN[tile * 9 + pos]
     return distance
 
 # this method produces the next board state to consider/expand
 def get_neighbors(state):
     # initialize list
     neighbors = []
-    # find coordinates of the blank tile
-    i, j = find_blank(state)
-    # define the four possible moves
-    moves = [(-1, 0, 'UP'), (1, 0, 'DOWN'), (0, -1, 'LEFT'), (0, 1, 'RIGHT')]
-
-    # try each direction; compute target coordinates (ni, nj) where the blank would land
-    for di, dj, move in moves:
-        ni, nj = i + di, j + dj
-        # the if clause is a boundary check - we must stay inside the 3x3 grid
-        if 0 <= ni < 3 and 0 <= nj < 3:
-            # turn state (tuple of tuples) into a list of lists so we can swap elements
-            new_state = [list(row) for row in state]
-            # value at the blank [i][j] and value at [ni][nj] is swapped
-            new_state[i][j], new_state[ni][nj] = new_state[ni][nj], new_state[i][j]
-            # after the swap, convert list of lists back into tuple of tuples
-            new_state = tuple(tuple(row) for row in new_state)
-            # records result as a pair
-            # new_state =  board after the move
-            # move = name of move (UP, DOWN etc)
-            neighbors.append((new_state, move))
+    # find the index of the blank tile
+    blank = find_blank(state)
+
+    # try each legal target index where the blank could land
+    for target, move in NEIGHBORS[blank]:
+        # copy the state into a bytearray so we can swap the blank with the tile at the target
+        new_state = bytearray(state)
+        new_state[blank], new_state[target] = new_state[target], new_state[blank]
+        # records result as a pair
+        # new_state =  board after the move (back to immutable bytes so it can be hashed)
+        # move = name of move (UP, DOWN etc)
+        neighbors.append((bytes(new_state), move))
 
     # return list of up to 4 neighbors
     return neighbors
@@ -135,7 +129,7 @@ def solve(start, heuristic='manhattan'):
     else:
         h_func = hamming
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     nodes_expanded = 0
 
     start_node = Node(start, None, None, 0, h_func(start))
@@ -160,7 +154,7 @@ def solve(start, heuristic='manhattan'):
                 path.append(node.move)
                 node = node.parent
             path.reverse()
-            return path, nodes_expanded, time.time() - start_time
+            return path, nodes_expanded, (time.perf_counter_ns() - start_time) * 1e-9
 
         # expand neighbors
         for next_state, move in get_neighbors(current.state):
@@ -184,13 +178,15 @@ def random_state():
     while True:
         tiles = list(range(9))
         random.shuffle(tiles)
-        state = tuple(tuple(tiles[i*3:i*3+3]) for i in range(3))
+        state = bytes(tiles)
         if is_solvable(state):
             return state
 
 def print_puzzle(state):
     print("-" * 13)
-    for row in state:
+    # print the flat state 3 tiles (one row) at a time
+    for i in range(0, 9, 3):
+        row = state[i:i+3]
         print("|", end="")
         for tile in row:
             if tile == 0:
@@ -205,27 +201,31 @@ def run_tests(n=100):
     print("8-Puzzle Solver - Testing", n, "random puzzles")
     print("="*60)
 
+    # make all the puzzles first so both heuristics are tested on the same ones
+    states = [random_state() for _ in range(n)]
+    states = [state for state in states if state != GOAL]
+
+    # each solve is independent, so run them across all cpu cores
+    print("Solving puzzles on all cores...")
+    tasks = [(state, h) for state in states for h in ('hamming', 'manhattan')]
+    # time the whole batch once, each solve still reports its own time
+    batch_start = time.perf_counter_ns()
+    with Pool() as pool:
+        results = pool.starmap(solve, tasks, chunksize=4)
+    batch_time = (time.perf_counter_ns() - batch_start) * 1e-9
+
     hamming_times = []
     hamming_nodes = []
     manhattan_times = []
     manhattan_nodes = []
 
-    for i in range(n):
-        print(f"Test {i+1}/{n}", end='\r')
-
-        state = random_state()
-        if state == GOAL:
-            continue
-
-        # test hamming
-        result = solve(state, 'hamming')
+    # results are in task order: hamming, manhattan, hamming, manhattan, ...
+    for result in results[0::2]:
         if result:
             _, nodes, t = result
             hamming_nodes.append(nodes)
             hamming_times.append(t)
-
-        # test manhattan
-        result = solve(state, 'manhattan')
+    for result in results[1::2]:
         if result:
             _, nodes, t = result
             manhattan_nodes.append(nodes)
@@ -234,7 +234,8 @@ def run_tests(n=100):
     print("\n\n" + "="*60)
     print("RESULTS")
     print("="*60)
-    print(f"Puzzles solved: {len(hamming_times)}/{n}\n")
+    print(f"Puzzles solved: {len(hamming_times)}/{n}")
+    print(f"Total wall time: {batch_time:.4f}s\n")
 
     print(f"{'Metric':<25} {'Hamming':<15} {'Manhattan':<15}")
     print("-"*60)
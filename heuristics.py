@@ -1,47 +1,43 @@
 # heuristics.py - Contains the heuristic functions for the 8-puzzle solver
 
 # Goal state for the puzzle
-GOAL = ((0, 1, 2),
-        (3, 4, 5),
-        (6, 7, 8))
+# states are packed into a single int: the tile at position i (row-major) lives in bits 4i..4i+3
+# so the goal board ((0, 1, 2), (3, 4, 5), (6, 7, 8)) packs to 0x876543210
+GOAL = 0x876543210
+
+# lookup tables indexed by tile * 9 + position, built once at import time
+# MANHATTAN gives how many steps a tile is from its goal position, HAMMING gives 1 if it's out of place
+# the blank (tile 0) never counts, so its rows are all 0
+MANHATTAN = [abs(pos // 3 - tile // 3) + abs(pos % 3 - tile % 3) if tile else 0
+             for tile in range(9) for pos in range(9)]
+HAMMING = [0 if tile == 0 or tile == pos else 1 for tile in range(9) for pos in range(9)]
 
 # hamming heuristic: returns the number of tiles in wrong position
-# inputs: state (tuple of tuples representing the puzzle)
+# inputs: state (packed int representing the puzzle)
 # outputs: number of misplaced tiles (int)
 # function: counts how many tiles are not in their correct position
 # time complexity: O(1) since it's always checking 9 positions
 # space complexity: O(1) for storing the count
 def hamming(state):
     count = 0
-    # iterate through each tile
-    for i in range(3):
-        for j in range(3):
-            # ignore blank tile
-            if state[i][j] != 0:
-                # the tile that *should* be at position [i][j] is at always at position [i*3+j]
-                if state[i][j] != i * 3 + j:
-                    # count goes up by 1 for each tile in wrong position
-                    count += 1
+    # iterate through each position, reading its tile out of the packed int
+    for pos in range(9):
+        tile = (state >> (4 * pos)) & 0xF
+        # table lookup is 1 for a misplaced tile, 0 otherwise (including the blank)
+        count += HAMMING[tile * 9 + pos]
     return count
 
 # manhattan heuristic: returns the sum of distances each tile is from its goal
-# inputs: state (tuple of tuples representing the puzzle)
+# inputs: state (packed int representing the puzzle)
 # outputs: sum of manhattan distances (int)
 # function: calculates total distance each tile needs to move to reach its goal position
 # time complexity: O(1) since it's always checking 9 positions
 # space complexity: O(1) for storing the distance sum
 def manhattan(state):
     distance = 0
-    # iterate through each tile
-    for i in range(3):
-        for j in range(3):
-            tile = state[i][j]
-            # ignore blank tile
-            if tile != 0:
-                # these two lines give the row/col where the tile actually belongs
-                goal_row = tile // 3
-                goal_col = tile % 3
-                # abs gives absolute values (no negatives)
-                # first term is vertical steps, second term is horizontal steps
-                distance += abs(i - goal_row) + abs(j - goal_col)
+    # iterate through each position, reading its tile out of the packed int
+    for pos in range(9):
+        tile = (state >> (4 * pos)) & 0xF
+        # table lookup replaces the row/col arithmetic (and is 0 for the blank)
+        distance += MANHATTAN[tile * 9 + pos]
     return distance
@@ -3,83 +3,125 @@
 import random
 from heuristics import GOAL
 
-# finds the position of the blank tile in the puzzle
-# inputs: state (tuple of tuples representing the puzzle)
-# outputs: row and column coordinates of the blank tile (tuple of ints)
-# function: searches through the puzzle to locate the empty space (represented by 0)
-# time complexity: O(1) since it's always checking 9 positions
-# space complexity: O(1) for storing the coordinates
-def find_blank(state):
+# numpy is optional, it's only used to generate many boards at once
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# packs a 3x3 board into a single int
+# inputs: board (tuple of tuples representing the puzzle)
+# outputs: packed state (int)
+# function: stores the tile at row i, col j in the 4-bit nibble at bits 4*(3i+j)..4*(3i+j)+3
+# time complexity: O(1) since it's always packing 9 positions
+# space complexity: O(1) for the packed int
+def pack(board):
+    state = 0
     for i in range(3):
         for j in range(3):
-            if state[i][j] == 0:
-                return i, j
+            state |= board[i][j] << (4 * (3 * i + j))
+    return state
+
+# unpacks a packed state back into a 3x3 board
+# inputs: state (packed int representing the puzzle)
+# outputs: board (tuple of tuples)
+# function: reads each 4-bit nibble out of the int and rebuilds the rows
+# time complexity: O(1) since it's always reading 9 positions
+# space complexity: O(1) for the board
+def unpack(state):
+    return tuple(tuple((state >> (4 * (3 * i + j))) & 0xF for j in range(3)) for i in range(3))
+
+# finds the position of the blank tile in the puzzle
+# inputs: state (packed int representing the puzzle)
+# outputs: index of the blank tile, 0-8 in row-major order (int)
+# function: shifts through the nibbles until it finds the empty space (represented by 0)
+# time complexity: O(1) since it's always checking at most 9 positions
+# space complexity: O(1) for storing the index
+def find_blank(state):
+    idx = 0
+    while (state >> (4 * idx)) & 0xF:
+        idx += 1
+    return idx
 
 # checks if a puzzle state can be solved
-# inputs: state (tuple of tuples representing the puzzle)
+# inputs: state (packed int representing the puzzle)
 # outputs: True if solvable, False otherwise (boolean)
-# function: counts inversions to determine if the puzzle has a solution
-# time complexity: O(n^2) where n is the number of tiles (9), so O(1) in practice
-# space complexity: O(n) for the flattened list, so O(1) in practice
+# function: the puzzle is solvable when the number of inversions between (non-blank) tiles is even.
+#           only the parity matters, so instead of counting inversion pairs we take the parity of the
+#           whole board as a permutation (from its cycles) and remove the blank's share of inversions:
+#           the blank (0) is inverted with every tile in front of it, which is exactly its index
+# time complexity: O(n) where n is the number of tiles (9), so O(1) in practice
+# space complexity: O(1), visited positions are tracked as bits of an int
 def is_solvable(state):
-    # "flatten" the puzzle into a list of tiles (this makes the blank disappear)
-    # we want it to disappear because it doesn't count as a tile, so it doesn't count towards inversions)
-    flat = []
-    for row in state:
-        for num in row:
-            if num != 0:
-                flat.append(num)
+    seen = 0
+    parity = 0
+    blank = 0
+    for start in range(9):
+        if (seen >> start) & 1:
+            continue
+        # follow the cycle position -> tile at that position until it comes back around
+        # a cycle of length k is k - 1 swaps, so it flips the parity when k is even
+        pos = start
+        length = 0
+        while not (seen >> pos) & 1:
+            seen |= 1 << pos
+            length += 1
+            tile = (state >> (4 * pos)) & 0xF
+            if tile == 0:
+                blank = pos
+            pos = tile
+        parity ^= (length - 1) & 1
 
-    # initialize inversions to 0
-    # count inversions (how many times a tile is larger than its neighbor)
-    # if the neighbor is larger, then the tile is an inversion
-    # if the neighbor is smaller, then the tile is not an inversion
-    # the puzzle is solvable if the number of inversions is even
-    inversions = 0
-    for i in range(len(flat)): # len returns the number of elements in the (flattened) list
-        for j in range(i + 1, len(flat)):
-            if flat[i] > flat[j]:
-                inversions += 1
+    # returns True if puzzle is solvable (even number of inversions between tiles), False otherwise
+    return parity == blank & 1
 
-    # returns True if puzzle is solvable (even number of inversions), False otherwise
-    return inversions % 2 == 0
+# NEIGHBOR_IDX[blank] lists every (target index, move name) the blank can slide to from that index
+# it is built once at import time so get_neighbors never has to do boundary checks
+NEIGHBOR_IDX = [[] for _ in range(9)]
+for _i in range(3):
+    for _j in range(3):
+        for _di, _dj, _move in [(-1, 0, 'UP'), (1, 0, 'DOWN'), (0, -1, 'LEFT'), (0, 1, 'RIGHT')]:
+            _ni, _nj = _i + _di, _j + _dj
+            # the if clause is a boundary check - we must stay inside the 3x3 grid
+            if 0 <= _ni < 3 and 0 <= _nj < 3:
+                NEIGHBOR_IDX[_i * 3 + _j].append((_ni * 3 + _nj, _move))
 
 # generates all possible next states from the current state
-# inputs: state (tuple of tuples representing the puzzle)
-# outputs: list of (next_state, move) tuples
+# inputs: state (packed int representing the puzzle), blank (index of the blank tile),
+#         prev_blank (where the blank was before the last move, -1 if there was no last move)
+# outputs: list of (next_state, next_blank, tile, move) tuples
 # function: finds all valid moves from the current state and returns the resulting states
 # time complexity: O(1) since there are at most 4 possible moves
 # space complexity: O(1) since we return at most 4 neighbors
-def get_neighbors(state):
+def get_neighbors(state, blank, prev_blank=-1):
     # initialize list
     neighbors = []
-    # find coordinates of the blank tile
-    i, j = find_blank(state)
-    # define the four possible moves
-    moves = [(-1, 0, 'UP'), (1, 0, 'DOWN'), (0, -1, 'LEFT'), (0, 1, 'RIGHT')]
+    blank_shift = 4 * blank
 
-    # try each direction; compute target coordinates (ni, nj) where the blank would land
-    for di, dj, move in moves:
-        ni, nj = i + di, j + dj
-        # the if clause is a boundary check - we must stay inside the 3x3 grid
-        if 0 <= ni < 3 and 0 <= nj < 3:
-            # turn state (tuple of tuples) into a list of lists so we can swap elements
-            new_state = [list(row) for row in state]
-            # value at the blank [i][j] and value at [ni][nj] is swapped
-            new_state[i][j], new_state[ni][nj] = new_state[ni][nj], new_state[i][j]
-            # after the swap, convert list of lists back into tuple of tuples
-            new_state = tuple(tuple(row) for row in new_state)
-            # records result as a pair
-            # new_state =  board after the move
-            # move = name of move (UP, DOWN etc)
-            neighbors.append((new_state, move))
+    # try each legal target index for the blank
+    for target, move in NEIGHBOR_IDX[blank]:
+        # skip the move that would just undo the last one (we'd be back at the parent state)
+        if target == prev_blank:
+            continue
+        target_shift = 4 * target
+        # read the tile that slides into the blank's spot
+        tile = (state >> target_shift) & 0xF
+        # the blank nibble is 0, so xor-ing the tile into both nibbles swaps them
+        new_state = state ^ (tile << blank_shift) ^ (tile << target_shift)
+        # records result as a 4-tuple
+        # new_state = board after the move
+        # target = where the blank ended up (and where the tile came from)
+        # tile = the tile that slid into the blank's old spot, so heuristics can be updated incrementally
+        # move = name of move (UP, DOWN etc)
+        neighbors.append((new_state, target, tile, move))
 
     # return list of up to 4 neighbors
     return neighbors
 
 # generates a random solvable puzzle state
 # inputs: none
-# outputs: random solvable state (tuple of tuples)
+# outputs: random solvable state (packed int)
 # function: keeps generating random states until it finds one that can be solved
 # time complexity: O(1) on average, but could be O(n) in worst case
 # space complexity: O(1) for storing the state
@@ -89,8 +131,44 @@ def generate_random_solvable_board():
         # create a list of numbers 0-8 and shuffle them randomly
         tiles = list(range(9))
         random.shuffle(tiles)
-        # convert the flat list into a 3x3 grid (tuple of tuples)
-        state = tuple(tuple(tiles[i*3:i*3+3]) for i in range(3))
+        # pack the flat list into a single int (position i goes in nibble i)
+        state = 0
+        for i, tile in enumerate(tiles):
+            state |= tile << (4 * i)
         # only return if this state is actually solvable
         if is_solvable(state):
             return state
+
+# generates many random solvable puzzle states at once
+# inputs: n (number of states to generate)
+# outputs: list of n random solvable states (packed ints)
+# function: shuffles whole batches of boards with numpy and keeps the ones with an even inversion count
+#           (falls back to calling generate_random_solvable_board n times without numpy);
+#           numpy's generator is seeded from the random module, so random.seed() makes it reproducible too
+# time complexity: O(n) on average, since about half of all shuffles are solvable
+# space complexity: O(n) for the batch of boards
+def generate_random_solvable_boards(n):
+    if not NUMPY_AVAILABLE:
+        return [generate_random_solvable_board() for _ in range(n)]
+
+    # upper[i, j] is True when position i comes before position j
+    upper = np.triu(np.ones((9, 9), dtype=bool), k=1)
+    # shift amounts that put position i in nibble i
+    shifts = 4 * np.arange(9, dtype=np.int64)
+
+    rng = np.random.default_rng(random.getrandbits(64))
+    states = []
+    while len(states) < n:
+        # about half of the shuffles are solvable, so make twice as many as we still need
+        m = 2 * (n - len(states)) + 8
+        # argsort of random numbers gives one random permutation of 0-8 per row
+        perms = np.argsort(rng.random((m, 9)), axis=1)
+        nonzero = perms != 0
+        # count pairs (i < j) of non-blank tiles where the earlier one is larger
+        inversions = ((perms[:, :, None] > perms[:, None, :]) & upper
+                      & nonzero[:, :, None] & nonzero[:, None, :]).sum(axis=(1, 2))
+        solvable = perms[inversions % 2 == 0].astype(np.int64)
+        # pack each surviving row into a single int
+        packed = (solvable << shifts).sum(axis=1)
+        states.extend(int(state) for state in packed)
+    return states[:n]
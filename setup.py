@@ -0,0 +1,10 @@
+# setup.py - Builds the optional Cython extension (_puzzle.pyx) used by solver.py
+# usage: python setup.py build_ext --inplace
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='8puzzle',
+    ext_modules=cythonize('_puzzle.pyx', language_level=3),
+)
@@ -0,0 +1,123 @@
+# solver_nb.py - Numba-compiled IDA* search for the 8-puzzle
+
+import time
+from heuristics import GOAL, HAMMING, MANHATTAN
+from puzzle_utils import NEIGHBOR_IDX, find_blank
+
+# numba is optional, solver.py falls back to the pure python ida* when it isn't installed
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# the deepest any 8-puzzle solution goes is 31 moves, so this leaves plenty of room
+MAX_DEPTH = 100
+# moves are stored as small ints inside the compiled code and turned back into names at the end
+MOVE_NAMES = ['UP', 'DOWN', 'LEFT', 'RIGHT']
+
+if NUMBA_AVAILABLE:
+    # NEIGHBOR_TABLE[blank] holds up to 4 target indices for the blank, padded with -1
+    # MOVE_TABLE[blank] holds the matching move codes (index into MOVE_NAMES)
+    NEIGHBOR_TABLE = np.full((9, 4), -1, dtype=np.int64)
+    MOVE_TABLE = np.full((9, 4), -1, dtype=np.int8)
+    for _blank in range(9):
+        for _k, (_target, _move) in enumerate(NEIGHBOR_IDX[_blank]):
+            NEIGHBOR_TABLE[_blank, _k] = _target
+            MOVE_TABLE[_blank, _k] = MOVE_NAMES.index(_move)
+
+    # int64 copies of the heuristic tables, built once instead of on every solve
+    MANHATTAN_NB = np.array(MANHATTAN, dtype=np.int64)
+    HAMMING_NB = np.array(HAMMING, dtype=np.int64)
+
+    # iterative-deepening a* over packed int64 states with an explicit stack instead of recursion
+    # inputs: start state, blank index, start h, h_table, neighbor/move tables, goal state
+    # outputs: (solution length, nodes expanded, move codes array), length is -1 if no solution
+    # function: same search as solver.ida_star, compiled so the hot loop never touches the interpreter
+    # time complexity: O(b^d) where b is branching factor (max 4) and d is solution depth
+    # space complexity: O(d) for the preallocated stack arrays
+    @njit(cache=True)
+    def ida_search(start, start_blank, start_h, h_table, neighbor_table, move_table, goal):
+        # one slot per depth: the state, where its blank is, its h, and which child to try next
+        states = np.empty(MAX_DEPTH, np.int64)
+        blanks = np.empty(MAX_DEPTH, np.int64)
+        hs = np.empty(MAX_DEPTH, np.int64)
+        next_child = np.empty(MAX_DEPTH, np.int64)
+        moves = np.empty(MAX_DEPTH, np.int8)
+        nodes_expanded = 0
+
+        bound = start_h
+        while True:
+            minimum = 1 << 62
+            depth = 0
+            states[0] = start
+            blanks[0] = start_blank
+            hs[0] = start_h
+            next_child[0] = 0
+            nodes_expanded += 1
+
+            while depth >= 0:
+                blank = blanks[depth]
+                k = next_child[depth]
+                # every child of this node has been tried, back up one level
+                if k == 4 or neighbor_table[blank, k] < 0:
+                    depth -= 1
+                    continue
+                next_child[depth] = k + 1
+
+                target = neighbor_table[blank, k]
+                # skip the move that would just put the blank back where it was
+                if depth > 0 and target == blanks[depth - 1]:
+                    continue
+
+                # slide the tile into the blank (xor swap) and update h incrementally
+                state = states[depth]
+                tile = (state >> (4 * target)) & 0xF
+                next_state = state ^ (tile << (4 * blank)) ^ (tile << (4 * target))
+                next_h = hs[depth] + h_table[tile * 9 + blank] - h_table[tile * 9 + target]
+
+                f = depth + 1 + next_h
+                if f > bound:
+                    if f < minimum:
+                        minimum = f
+                    continue
+
+                moves[depth] = move_table[blank, k]
+                if next_state == goal:
+                    return depth + 1, nodes_expanded, moves
+
+                depth += 1
+                states[depth] = next_state
+                blanks[depth] = target
+                hs[depth] = next_h
+                next_child[depth] = 0
+                nodes_expanded += 1
+
+            # nothing under the bound reached the goal (shouldn't happen for solvable puzzles)
+            if minimum == 1 << 62:
+                return -1, nodes_expanded, moves
+            bound = minimum
+
+# runs the compiled ida* and converts its result back into the format solver.solve returns
+# inputs: start state (packed int), heuristic function, heuristic lookup table
+# outputs: solution path (list of moves), nodes expanded (int), time taken (float)
+# function: drop-in replacement for solver.ida_star when numba is installed
+# time complexity: O(b^d) where b is branching factor (max 4) and d is solution depth
+# space complexity: O(d) for the stack arrays
+def ida_star_nb(start, h_func, h_table):
+    # start timing how long the search takes
+    start_time = time.perf_counter_ns()
+    table = MANHATTAN_NB if h_table is MANHATTAN else HAMMING_NB
+
+    length, nodes_expanded, moves = ida_search(start, find_blank(start), h_func(start),
+                                               table, NEIGHBOR_TABLE, MOVE_TABLE, GOAL)
+    if length < 0:
+        return None
+    path = [MOVE_NAMES[code] for code in moves[:length]]
+    return path, int(nodes_expanded), (time.perf_counter_ns() - start_time) * 1e-9
+
+# compile (or load from cache) ida_search now, on the board one move from the goal (tile 1 and the blank swapped),
+# so the first timed solve in each process doesn't pay for it; pool workers inherit it already warm
+if NUMBA_AVAILABLE:
+    ida_search(GOAL ^ 0x11, 1, 1, MANHATTAN_NB, NEIGHBOR_TABLE, MOVE_TABLE, GOAL)
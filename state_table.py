@@ -0,0 +1,110 @@
+# state_table.py - Precomputed optimal moves for every solvable 8-puzzle state
+
+import os
+import pickle
+import tempfile
+import time
+from collections import deque
+from heuristics import GOAL
+from puzzle_utils import NEIGHBOR_IDX, find_blank, get_neighbors
+
+# the move that undoes each move (the blank going back the way it came)
+OPPOSITE = {'UP': 'DOWN', 'DOWN': 'UP', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}
+
+# where load_optimal_table saves the table so it only has to be built once
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'optimal_table.pickle')
+
+# builds the distance and next-move tables for every state reachable from the goal
+# inputs: none
+# outputs: dist (dict of state -> moves to goal), next_move (dict of state -> first move of an optimal path)
+# function: runs one breadth-first search backwards from the goal over all 181,440 solvable states;
+#           the move that reached a state, reversed, is the first step of a shortest path back to the goal
+# time complexity: O(V + E) where V is 181,440 states and E is at most 4 moves per state
+# space complexity: O(V) for the two tables and the queue
+def build_optimal_table():
+    dist = {GOAL: 0}
+    next_move = {}
+    queue = deque([(GOAL, find_blank(GOAL))])
+    while queue:
+        state, blank = queue.popleft()
+        for next_state, next_blank, _, move in get_neighbors(state, blank):
+            if next_state not in dist:
+                dist[next_state] = dist[state] + 1
+                next_move[next_state] = OPPOSITE[move]
+                queue.append((next_state, next_blank))
+    return dist, next_move
+
+# loads the tables from TABLE_FILE, building and saving them first if the file doesn't exist yet
+# inputs: path (file to read/write, default TABLE_FILE)
+# outputs: dist, next_move (same as build_optimal_table)
+# function: caches the one-time breadth-first search across runs with pickle; the file is written to a
+#           temporary file and renamed into place, so other processes never see it half-written,
+#           and a file that can't be unpickled (e.g. from an interrupted older run) is rebuilt
+# time complexity: O(V) to read (or build) the tables
+# space complexity: O(V) for the tables
+def load_optimal_table(path=TABLE_FILE):
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (EOFError, pickle.UnpicklingError):
+            pass
+    tables = build_optimal_table()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # os.replace is atomic, readers see either no file or the complete one
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tables
+
+# the pattern database, loaded the first time load_pattern_database is called
+_pattern_database = None
+
+# returns the exact distance to the goal for every solvable state, for use as a heuristic
+# inputs: none
+# outputs: dict of state (packed int) -> number of moves to the goal
+# function: reuses the dist table from load_optimal_table (a full pattern database covering all 8 tiles),
+#           loading it once per process; since it's the true distance, a* and ida* only expand nodes
+#           on an optimal path
+# time complexity: O(V) the first time, O(1) after that
+# space complexity: O(V) for the table
+def load_pattern_database():
+    global _pattern_database
+    if _pattern_database is None:
+        _pattern_database = load_optimal_table()[0]
+    return _pattern_database
+
+# solves a puzzle by reading moves out of the precomputed table instead of searching
+# inputs: start state (packed int), tables (dist, next_move), loaded from TABLE_FILE if not given
+# outputs: solution path (list of moves), nodes expanded (always 0), time taken (float)
+# function: repeatedly applies the stored optimal move until the goal is reached
+# time complexity: O(d) where d is the solution length
+# space complexity: O(d) for the path
+def solve_from_table(start, tables=None):
+    if tables is None:
+        tables = load_optimal_table()
+    dist, next_move = tables
+
+    # states missing from the table can't reach the goal
+    if start not in dist:
+        return None
+
+    start_time = time.perf_counter_ns()
+    path = []
+    state = start
+    blank = find_blank(start)
+    while state != GOAL:
+        move = next_move[state]
+        # find the target index for that move and slide the tile into the blank
+        for target, name in NEIGHBOR_IDX[blank]:
+            if name == move:
+                break
+        tile = (state >> (4 * target)) & 0xF
+        state = state ^ (tile << (4 * blank)) ^ (tile << (4 * target))
+        blank = target
+        path.append(move)
+    return path, 0, (time.perf_counter_ns() - start_time) * 1e-9